@@ -7,7 +7,9 @@ from enum import Enum
 from datetime import date
 from dateutil.relativedelta import relativedelta
 from typing import NamedTuple, Optional, Callable
+from collections.abc import Iterable
 import itertools
+import numpy as np
 from abc import abstractmethod
 
 from fixedIncome.src.scheduling_tools.scheduler import Scheduler
@@ -34,6 +36,59 @@ class SwapAccrual(NamedTuple):
     accrual_factor: Optional[float] = None
 
 
+class SwapAccrualSchedule:
+    """
+    A structure-of-arrays representation of a swap leg's accrual schedule. The start dates,
+    end dates, and accrual factors are stored as parallel arrays so that payment amounts can
+    be computed with vectorized arithmetic on the accrual factors, while iteration and
+    indexing still yield individual SwapAccrual tuples for row-wise consumers.
+    """
+    def __init__(self,
+                 start_accruals: Iterable[date],
+                 end_accruals: Iterable[date],
+                 accrual_factors: Iterable[float],
+                 fixing_dates: Optional[Iterable[date]] = None) -> None:
+        self.start_accruals = list(start_accruals)
+        self.end_accruals = list(end_accruals)
+        self.accrual_factors = np.asarray(accrual_factors, dtype=np.float64)
+        self.fixing_dates = list(fixing_dates) if fixing_dates is not None else [None] * len(self.start_accruals)
+
+        if not len(self.start_accruals) == len(self.end_accruals) == len(self.accrual_factors) == len(self.fixing_dates):
+            raise ValueError('All accrual schedule arrays must have the same length.')
+
+    def __len__(self) -> int:
+        return len(self.start_accruals)
+
+    def __iter__(self):
+        return (SwapAccrual(start_accrual=start_accrual,
+                            end_accrual=end_accrual,
+                            fixing_date=fixing_date,
+                            accrual_factor=accrual_factor)
+                for start_accrual, end_accrual, fixing_date, accrual_factor
+                in zip(self.start_accruals, self.end_accruals, self.fixing_dates, self.accrual_factors))
+
+    def __getitem__(self, index: int) -> SwapAccrual:
+        return SwapAccrual(start_accrual=self.start_accruals[index],
+                           end_accrual=self.end_accruals[index],
+                           fixing_date=self.fixing_dates[index],
+                           accrual_factor=self.accrual_factors[index])
+
+
+PAYMENT_FREQUENCY_TO_INCREMENT: dict[PaymentFrequency, relativedelta] = {
+    PaymentFrequency.ANNUAL: relativedelta(years=-1),
+    PaymentFrequency.SEMI_ANNUAL: relativedelta(months=-6),
+    PaymentFrequency.QUARTERLY: relativedelta(months=-3)
+}
+
+# fixed-denominator day count conventions whose accrual factors are simply
+# actual days divided by the denominator, and hence vectorize over date arrays
+DAY_COUNT_CONVENTION_TO_DENOMINATOR: dict[DayCountConvention, float] = {
+    DayCountConvention.ACTUAL_OVER_360: 360.0,
+    DayCountConvention.ACTUAL_OVER_365: 365.0,
+    DayCountConvention.ACTUAL_OVER_365_POINT_25: 365.25
+}
+
+
 class FixedToFloatInterestRateSwap(CashflowCollection):
     def __init__(self,
                  float_index: CurveIndex,
@@ -70,6 +125,8 @@ class FixedToFloatInterestRateSwap(CashflowCollection):
         self._business_day_adjustment = business_day_adjustment
         self._date_adjustment_function = self._create_date_adjustment_function()
         self._start_accrual_date, self._end_accrual_date = self.calculate_start_end_accrual_dates()
+        self._floating_leg_accrual_schedule: Optional[SwapAccrualSchedule] = None
+        self._fixed_leg_accrual_schedule: Optional[SwapAccrualSchedule] = None
 
         cashflows = (None, None)
 
@@ -231,79 +288,63 @@ class FixedToFloatInterestRateSwap(CashflowCollection):
                 raise ValueError(f" Business day adjustment {self.business_day_adjustment} is invalid.")
 
 
-    def generate_floating_leg_accrual_schedule(self) -> list[SwapAccrual]:
+    def _generate_accrual_schedule(self,
+                                   payment_frequency: PaymentFrequency,
+                                   day_count_convention: DayCountConvention) -> SwapAccrualSchedule:
         """
-        Returns a list of SwapAccrual corresponding to all payments of the floating leg.
+        Constructs the accrual schedule for a swap leg with the provided payment frequency
+        and day count convention. Accrual dates are generated backwards from the end accrual
+        date, business-day adjusted, and collected into a SwapAccrualSchedule together
+        with their accrual factors.
         """
-        match self.floating_leg_payment_frequency:
-            case PaymentFrequency.ANNUAL:
-                increment = relativedelta(years=-1)
-
-            case PaymentFrequency.SEMI_ANNUAL:
-                increment = relativedelta(months=-6)
-
-            case PaymentFrequency.QUARTERLY:
-                increment = relativedelta(months=-3)
-
-            case _:
-                raise ValueError(f'Payment Frequency {self.floating_leg_payment_frequency} is not valid to generate a floating leg payment schedule.')
+        try:
+            increment = PAYMENT_FREQUENCY_TO_INCREMENT[payment_frequency]
+        except KeyError:
+            raise ValueError(f'Payment Frequency {payment_frequency} is not valid to generate a swap leg payment schedule.')
 
         unadjusted_accrual_dates = Scheduler.generate_dates_by_increments(start_date=self.end_accrual_date,
                                                                           end_date=self.start_accrual_date,
                                                                           increment=increment)
         unadjusted_accrual_dates.reverse()
-        adjusted_accrual_dates = [self.date_adjustment_function(accrual_date) for accrual_date in unadjusted_accrual_dates]
-        swap_accruals = []
-
-        for start_accrual, end_accrual in itertools.pairwise(adjusted_accrual_dates):
-            accrual = DayCountCalculator.compute_accrual_length(start_accrual,
-                                                                end_accrual,
-                                                                self.floating_leg_day_count_convention)
-
-            swap_accrual = SwapAccrual(start_accrual=start_accrual,
-                                       end_accrual=end_accrual,
-                                       accrual_factor=accrual)
-
-            swap_accruals.append(swap_accrual)
-
-        return swap_accruals
-
-
-    def generate_fixed_leg_accrual_schedule(self) -> list[SwapAccrual]:
+        adjusted_accrual_dates = Scheduler.adjust_dates(unadjusted_accrual_dates,
+                                                        business_day_adjustment=self.business_day_adjustment,
+                                                        holiday_calendar=self.holiday_calendar)
+        denominator = DAY_COUNT_CONVENTION_TO_DENOMINATOR.get(day_count_convention)
+
+        if denominator is not None:
+            accrual_days = np.diff(np.array(adjusted_accrual_dates, dtype='datetime64[D]'))
+            accrual_factors = accrual_days.astype(np.float64) / denominator
+        else:
+            accrual_factors = [DayCountCalculator.compute_accrual_length(start_accrual,
+                                                                         end_accrual,
+                                                                         day_count_convention)
+                               for start_accrual, end_accrual in itertools.pairwise(adjusted_accrual_dates)]
+
+        return SwapAccrualSchedule(start_accruals=adjusted_accrual_dates[:-1],
+                                   end_accruals=adjusted_accrual_dates[1:],
+                                   accrual_factors=accrual_factors)
+
+
+    def generate_floating_leg_accrual_schedule(self) -> SwapAccrualSchedule:
         """
-        Returns a list of SwapAccrual corresponding to all payments of the fixed leg.
+        Returns a SwapAccrualSchedule corresponding to all payments of the floating leg.
+        The schedule is a constant for the swap's lifetime, so it is computed once and cached.
         """
+        if self._floating_leg_accrual_schedule is None:
+            self._floating_leg_accrual_schedule = self._generate_accrual_schedule(self.floating_leg_payment_frequency,
+                                                                                  self.floating_leg_day_count_convention)
+        return self._floating_leg_accrual_schedule
 
-        match self.fixed_leg_payment_frequency:
-            case PaymentFrequency.ANNUAL:
-                increment = relativedelta(years=-1)
-
-            case PaymentFrequency.SEMI_ANNUAL:
-                increment = relativedelta(months=-6)
-
-            case PaymentFrequency.QUARTERLY:
-                increment = relativedelta(months=-3)
-            case _:
-                raise ValueError(
-                    f'Payment Frequency {self.fixed_leg_payment_frequency} is not valid to generate a floating leg payment schedule.')
-
-        unadjusted_accrual_dates = Scheduler.generate_dates_by_increments(start_date=self.end_accrual_date,
-                                                                          end_date=self.start_accrual_date,
-                                                                          increment=increment)
-        unadjusted_accrual_dates.reverse()
-        adjusted_accrual_dates = [self.date_adjustment_function(accrual_date) for accrual_date in unadjusted_accrual_dates]
-        fixed_leg_accruals = []
-
-        for start_accrual, end_accrual in itertools.pairwise(adjusted_accrual_dates):
-            accrual = DayCountCalculator.compute_accrual_length(start_accrual,
-                                                                end_accrual,
-                                                                self.fixed_leg_day_count_convention)
-
-            fixed_leg_accruals.append(SwapAccrual(start_accrual=start_accrual,
-                                                  end_accrual=end_accrual,
-                                                  accrual_factor=accrual))
 
-        return fixed_leg_accruals
+    def generate_fixed_leg_accrual_schedule(self) -> SwapAccrualSchedule:
+        """
+        Returns a SwapAccrualSchedule corresponding to all payments of the fixed leg.
+        The schedule is a constant for the swap's lifetime, so it is computed once and cached.
+        """
+        if self._fixed_leg_accrual_schedule is None:
+            self._fixed_leg_accrual_schedule = self._generate_accrual_schedule(self.fixed_leg_payment_frequency,
+                                                                               self.fixed_leg_day_count_convention)
+        return self._fixed_leg_accrual_schedule
 
 
     @abstractmethod
@@ -325,18 +366,13 @@ class FixedToFloatInterestRateSwap(CashflowCollection):
         for each accrual_factor in the SwapAccrual list. Returns a Cashflow containing all these payments.
         """
         fixed_leg_accruals = self.generate_fixed_leg_accrual_schedule()
-        fixed_payments = []
-
-        for accrual in fixed_leg_accruals:
-            payment_amount = accrual.accrual_factor * self.notional * self.fixed_rate
-            payment_date = Scheduler.calculate_settlement_date(accrual.end_accrual,
-                                                               self.payment_delay,
-                                                               self.holiday_calendar)
-
-            payment = Payment(payment_date=payment_date, payment=payment_amount)
-            fixed_payments.append(payment)
+        payment_amounts = fixed_leg_accruals.accrual_factors * (self.notional * self.fixed_rate)
+        payment_dates = Scheduler.calculate_settlement_dates(fixed_leg_accruals.end_accruals,
+                                                             self.payment_delay,
+                                                             self.holiday_calendar)
 
-        fixed_cf = Cashflow(fixed_payments)
+        fixed_cf = Cashflow(Payment(payment_date=payment_date, payment=payment_amount)
+                            for payment_date, payment_amount in zip(payment_dates, payment_amounts))
 
         if set_cashflow:
             self[CashflowKeys.FIXED_LEG] = fixed_cf
@@ -353,14 +389,13 @@ class FixedToFloatInterestRateSwap(CashflowCollection):
         float_pv = discount_curve.present_value(float_cashflow)
 
         fixed_accruals = self.generate_fixed_leg_accrual_schedule()
-        discounted_fixed_accruals = 0.0
-        for accrual in fixed_accruals:
-            accrual_times_notional = accrual.accrual_factor * self.notional
-            payment_date = Scheduler.calculate_settlement_date(accrual.end_accrual,
-                                                               self.payment_delay,
-                                                               self.holiday_calendar)
-
-            discounted_fixed_accruals += discount_curve(payment_date) * accrual_times_notional
+        payment_dates = Scheduler.calculate_settlement_dates(fixed_accruals.end_accruals,
+                                                             self.payment_delay,
+                                                             self.holiday_calendar)
+        discount_factors = np.fromiter((discount_curve(payment_date) for payment_date in payment_dates),
+                                       dtype=np.float64,
+                                       count=len(fixed_accruals))
+        discounted_fixed_accruals = (discount_factors @ fixed_accruals.accrual_factors) * self.notional
 
         return float_pv / discounted_fixed_accruals
 
@@ -383,24 +418,25 @@ class TermInterestRateSwap(FixedToFloatInterestRateSwap):
         """
 
         floating_leg_accruals = self.generate_floating_leg_accrual_schedule()
-        floating_payments = []
+        fixing_dates = Scheduler.calculate_settlement_dates(floating_leg_accruals.start_accruals,
+                                                            self.fixing_date_for_accrual_period,
+                                                            self.holiday_calendar)
 
-        for accrual in floating_leg_accruals:
-            fixing_date = Scheduler.calculate_settlement_date(accrual.start_accrual,
-                                                              self.fixing_date_for_accrual_period,
-                                                              self.holiday_calendar)
+        payment_dates = Scheduler.calculate_settlement_dates(floating_leg_accruals.end_accruals,
+                                                             self.payment_delay,
+                                                             self.holiday_calendar)
 
-            interest_rate_fixing = interest_rate(fixing_date)
+        if isinstance(interest_rate, Curve):
+            interest_rate_fixings = interest_rate.interpolate_batch(fixing_dates)
+        else:
+            interest_rate_fixings = np.fromiter((interest_rate(fixing_date) for fixing_date in fixing_dates),
+                                                dtype=np.float64,
+                                                count=len(fixing_dates))
 
-            payment_date = Scheduler.calculate_settlement_date(accrual.end_accrual,
-                                                               self.payment_delay,
-                                                               self.holiday_calendar)
+        payment_amounts = floating_leg_accruals.accrual_factors * self.notional * interest_rate_fixings
 
-            payment_amount = accrual.accrual_factor * self.notional * interest_rate_fixing
-            payment = Payment(payment_date=payment_date, payment=payment_amount)
-            floating_payments.append(payment)
-
-        floating_cf = Cashflow(floating_payments)
+        floating_cf = Cashflow(Payment(payment_date=payment_date, payment=payment_amount)
+                               for payment_date, payment_amount in zip(payment_dates, payment_amounts))
 
         if set_cashflow:
             self[CashflowKeys.FLOATING_LEG] = floating_cf
@@ -453,14 +489,12 @@ class OvernightIndexSwap(FixedToFloatInterestRateSwap):
         """
 
         floating_leg_accruals = self.generate_floating_leg_accrual_schedule()
+        payment_dates = Scheduler.calculate_settlement_dates(floating_leg_accruals.end_accruals,
+                                                             self.payment_delay,
+                                                             self.holiday_calendar)
         floating_payments = []
 
-        for accrual in floating_leg_accruals:
-
-            payment_date = Scheduler.calculate_settlement_date(accrual.end_accrual,
-                                                               self.payment_delay,
-                                                               self.holiday_calendar)
-
+        for accrual, payment_date in zip(floating_leg_accruals, payment_dates):
             annualized_rate = self.calculate_annualized_rate(interest_rate=interest_rate,
                                                              start_date=accrual.start_accrual,
                                                              end_date=accrual.end_accrual)
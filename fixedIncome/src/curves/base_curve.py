@@ -9,6 +9,7 @@ Each subclass will provide additional functionality.
 from datetime import date, datetime
 from typing import Iterable, Optional, Protocol
 from collections.abc import Callable
+import numpy as np
 import scipy
 from typing import NamedTuple
 from fixedIncome.src.scheduling_tools.day_count_calculator import DayCountConvention, DayCountCalculator
@@ -126,6 +127,25 @@ class Curve(Callable):
             x_axis_val = self.date_to_interpolation_axis(date_obj)
             return self.interpolator(x_axis_val) + adjustment(date_obj)
 
+    def interpolate_batch(self, date_objs: Iterable[date]) -> np.ndarray:
+        """
+        Vectorized companion to interpolate for a sequence of dates. When every date lies
+        within the knot range, the dates are evaluated in a single call to the underlying
+        interpolator; otherwise the method falls back to the scalar interpolate per date
+        so the end behaviors apply unchanged.
+        """
+        date_objs = list(date_objs)
+        first_date = self.interpolation_values[0].knot
+        last_date = self.interpolation_values[-1].knot
+
+        if any(date_obj < first_date or date_obj > last_date for date_obj in date_objs):
+            return np.array([self.interpolate(date_obj) for date_obj in date_objs], dtype=np.float64)
+
+        x_axis_vals = np.fromiter((self.date_to_interpolation_axis(date_obj) for date_obj in date_objs),
+                                  dtype=np.float64,
+                                  count=len(date_objs))
+        return np.asarray(self.interpolator(x_axis_vals), dtype=np.float64)
+
     def reset_interpolation_values(self, new_values: Iterable[KnotValuePair]) -> None:
         """
         Resets the interpolator based on new KnotValuePairs.
@@ -6,9 +6,10 @@ Unit tests are contained in fixedIncome.tests.test_scheduling_tools.test_schedul
 
 from datetime import date, datetime, timedelta
 from dateutil.relativedelta import relativedelta
-import pandas as pd  # type: ignore
+from collections.abc import Iterable
+import numpy as np
 from fixedIncome.src.scheduling_tools.schedule_enumerations import Weekdays
-from fixedIncome.src.scheduling_tools.schedule_enumerations import SettlementConvention
+from fixedIncome.src.scheduling_tools.schedule_enumerations import SettlementConvention, BusinessDayAdjustment
 from fixedIncome.src.scheduling_tools.holidays import (generate_all_holidays,
                                                        Holiday,
                                                        get_next_weekday)
@@ -187,6 +188,55 @@ class Scheduler(object):
         else:
             return Scheduler.add_business_days(date_obj, business_days=-1, holiday_calendar=holiday_calendar)
 
+    @staticmethod
+    def _holiday_dates_as_datetime64(from_year: int, to_year: int, holiday_calendar: dict[str, Holiday]) -> np.ndarray:
+        """
+        A helper method which collects the holiday dates for the provided range of years into a
+        sorted numpy datetime64[D] array suitable for numpy's business day functionality.
+        Each holiday is only included for the year it falls in, matching is_business_day, which
+        generates a date's own calendar year of holidays when testing it.
+        """
+        holiday_dates = {holiday_date
+                         for year in range(from_year, to_year + 1)
+                         for holiday_date in generate_all_holidays(from_year=year,
+                                                                   to_year=year,
+                                                                   holiday_calendar=holiday_calendar)
+                         if holiday_date.year == year}
+
+        return np.array(sorted(holiday_dates), dtype='datetime64[D]')
+
+    @staticmethod
+    def adjust_dates(dates: Iterable[date],
+                     business_day_adjustment: BusinessDayAdjustment,
+                     holiday_calendar: dict[str, Holiday]) -> list[date]:
+        """
+        Applies the provided business day adjustment to a whole sequence of dates at once.
+        Equivalent to mapping following_date_adjustment or modified_following_date_adjustment
+        over the dates, but the weekend and holiday checks are vectorized through
+        numpy's busday_offset rather than performed one date at a time.
+        """
+        dates = list(dates)
+        if not dates:
+            return []
+
+        match business_day_adjustment:
+            case BusinessDayAdjustment.FOLLOWING:
+                roll = 'following'
+            case BusinessDayAdjustment.MODIFIED_FOLLOWING:
+                roll = 'modifiedfollowing'
+            case _:
+                raise ValueError(f'Business day adjustment {business_day_adjustment} is invalid.')
+
+        holiday_dates = Scheduler._holiday_dates_as_datetime64(from_year=min(dates).year,
+                                                               to_year=max(dates).year + 1,
+                                                               holiday_calendar=holiday_calendar)
+
+        adjusted_dates = np.busday_offset(np.array(dates, dtype='datetime64[D]'),
+                                          offsets=0,
+                                          roll=roll,
+                                          holidays=holiday_dates)
+        return adjusted_dates.tolist()
+
     @staticmethod
     def _is_relative_delta_positive(increment: relativedelta, base_date: date | datetime) -> bool:
         """ A helper method which tests if a relative delta is a positive or negative
@@ -248,4 +298,53 @@ class Scheduler(object):
             case _:
                 raise ValueError(f"Settlement Convention {settlement_convention} is invalid.")
 
+    @staticmethod
+    def calculate_settlement_dates(
+            purchase_dates: Iterable[date],
+            settlement_convention: SettlementConvention,
+            holiday_calendar: dict[str, Holiday]) -> list[date]:
+        """
+        Batch version of calculate_settlement_date. Computes the settlement dates for a whole
+        sequence of purchase dates at once using numpy's busday_offset, with the weekend and
+        holiday checks vectorized over the full sequence.
+        """
+        purchase_dates = list(purchase_dates)
+        if not purchase_dates:
+            return []
+
+        match settlement_convention:
+            case SettlementConvention.T_MINUS_TWO_BUSINESS:
+                offset, roll = -2, 'following'
+
+            case SettlementConvention.T_MINUS_ONE_BUSINESS:
+                offset, roll = -1, 'following'
+
+            case SettlementConvention.T_MINUS_ZERO_BUSINESS:
+                offset, roll = 0, 'preceding'
+
+            case SettlementConvention.T_PLUS_ZERO_BUSINESS:
+                offset, roll = 0, 'following'
+
+            case SettlementConvention.T_PLUS_ONE_BUSINESS:
+                offset, roll = 1, 'following'
+
+            case SettlementConvention.T_PLUS_TWO_BUSINESS:
+                offset, roll = 2, 'following'
+
+            case SettlementConvention.T_PLUS_THREE_BUSINESS:
+                offset, roll = 3, 'following'
+
+            case _:
+                raise ValueError(f"Settlement Convention {settlement_convention} is invalid.")
+
+        holiday_dates = Scheduler._holiday_dates_as_datetime64(from_year=min(purchase_dates).year - 1,
+                                                               to_year=max(purchase_dates).year + 1,
+                                                               holiday_calendar=holiday_calendar)
+
+        settlement_dates = np.busday_offset(np.array(purchase_dates, dtype='datetime64[D]'),
+                                            offsets=offset,
+                                            roll=roll,
+                                            holidays=holiday_dates)
+        return settlement_dates.tolist()
+
 
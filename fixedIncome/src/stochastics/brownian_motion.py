@@ -6,33 +6,90 @@ Unit tests are contained in fixedIncome.tests.test_stochastics.test_brownian_mot
 import bisect
 import itertools
 
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import math
 import numpy as np
+from numba import njit, guvectorize
+from scipy.linalg.blas import dtrmm, strmm
 from typing import Optional
 from collections.abc import Callable
-import itertools
-import pandas as pd
 
 from fixedIncome.src.scheduling_tools.schedule_enumerations import DayCountConvention
 from fixedIncome.src.scheduling_tools.day_count_calculator import DayCountCalculator
 from fixedIncome.src.scheduling_tools.scheduler import Scheduler
 
+@njit(cache=True, fastmath=True)
+def _interp_path(path: np.ndarray, interpolation_float: float) -> np.ndarray:
+    """
+    The pure-numeric interpolation kernel. Linearly interpolates each row of the path
+    at the fractional column index interpolation_float. JIT-compiled because this is
+    the hot inner loop when a path is sampled at many dates during pricing.
+    """
+    lower = int(interpolation_float)
+    weight = interpolation_float - lower
+    upper = lower + 1 if lower + 1 < path.shape[1] else lower
+    return path[:, lower] * (1.0 - weight) + path[:, upper] * weight
+
+
+@guvectorize(['void(float32[:, :], float64, float32[:])',
+              'void(float64[:, :], float64, float64[:])'], '(d,n),()->(d)', cache=True)
+def _interp_path_batch(path: np.ndarray, interpolation_float: float, out: np.ndarray) -> None:
+    """
+    Generalized-ufunc version of _interp_path. Broadcasting over an array of
+    fractional column indices amortizes the dispatch overhead across all query
+    dates in a single compiled call.
+    """
+    lower = int(interpolation_float)
+    weight = interpolation_float - lower
+    upper = lower + 1 if lower + 1 < path.shape[1] else lower
+    for row in range(path.shape[0]):
+        out[row] = path[row, lower] * (1.0 - weight) + path[row, upper] * weight
+
+
+@njit(cache=True)
+def _mix_and_accumulate(lower_triangular_mat: np.ndarray, scaled_increments: np.ndarray) -> np.ndarray:
+    """
+    Fuses the Cholesky correlation mixing and the cumulative sum into a single pass
+    over the increments, producing the dimension x (num_steps + 1) path array directly.
+    Exploits the lower-triangular structure of the mixing matrix and avoids the
+    intermediate mixed-increments array entirely.
+    """
+    dimension, num_steps = scaled_increments.shape
+    paths = np.zeros((dimension, num_steps + 1), dtype=scaled_increments.dtype)
+
+    for step in range(num_steps):
+        for row in range(dimension):
+            mixed_increment = 0.0
+            for col in range(row + 1):
+                mixed_increment += lower_triangular_mat[row, col] * scaled_increments[col, step]
+            paths[row, step + 1] = paths[row, step] + mixed_increment
+
+    return paths
+
+
 def datetime_to_path_call(
         datetime_obj: datetime,
         start_date_time: datetime,
         end_date_time: datetime,
         day_count_convention: DayCountConvention,
         datetime_grid: list[datetime],
-        path: Optional[np.ndarray] = None
+        path: Optional[np.ndarray] = None,
+        dt_increments: Optional[np.ndarray] = None,
+        time_grid: Optional[np.ndarray] = None
 ) -> float | np.ndarray:
     """
     A generic function for interpolating a path, represented as a np.ndarray, using a
     start and end datetime which are assumed to be the datetimes of the starting and
     ending indices of the array. The function will linearly interpolate path values
     between the nearest indices corresponding to the provided datetime.
+
+    The optional dt_increments argument allows the caller to provide the precomputed
+    accrual lengths of the grid segments, skipping one accrual computation per call.
+    The optional time_grid argument is the precomputed array of cumulative accrual
+    lengths of the grid points from the start datetime; when provided, the grid index
+    is found by np.searchsorted on that array and only a single accrual computation
+    (datetime to elapsed time) is performed per call.
     """
     if path is None:
         raise ValueError('Brownian Motion called when path is None. '
@@ -42,29 +99,41 @@ def datetime_to_path_call(
         raise ValueError(f'Provided datetime {str(datetime_obj)} is outside of'
                          f'the range {str(start_date_time)} to {str(end_date_time)}.')
 
-    #num_steps = path.shape[1] if len(path.shape) >= 2 else len(path)
-
-    lower_datetime_index = bisect.bisect_left(datetime_grid, x=datetime_obj)
-
-    if datetime_obj == datetime_grid[lower_datetime_index]:
-        return path[:, lower_datetime_index]
+    path = np.asarray(path)
+
+    if time_grid is not None:
+        elapsed_time = DayCountCalculator.compute_accrual_length(start_date=start_date_time,
+                                                                 end_date=datetime_obj,
+                                                                 dcc=day_count_convention)
+
+        lower_index = int(np.searchsorted(time_grid, elapsed_time, side='right')) - 1
+        lower_index = min(max(lower_index, 0), len(time_grid) - 2)
+        segment_length = time_grid[lower_index + 1] - time_grid[lower_index]
+        weight = (elapsed_time - time_grid[lower_index]) / segment_length if segment_length > 0.0 else 0.0
+        weight = min(max(weight, 0.0), 1.0)  # guard against round-off at the grid points
+        return _interp_path(path, lower_index + weight)
+
+    insertion_index = bisect.bisect_left(datetime_grid, x=datetime_obj)
+    lower_datetime_index = insertion_index if datetime_grid[insertion_index] == datetime_obj \
+        else insertion_index - 1
+    upper_datetime_index = min(lower_datetime_index + 1, len(datetime_grid) - 1)
+
+    if dt_increments is not None and lower_datetime_index < len(dt_increments):
+        grid_segment_length = dt_increments[lower_datetime_index]
+    else:
+        grid_segment_length = DayCountCalculator.compute_accrual_length(start_date=datetime_grid[lower_datetime_index],
+                                                                        end_date=datetime_grid[upper_datetime_index],
+                                                                        dcc=day_count_convention)
 
-    upper_datetime_index = lower_datetime_index + 1
     time_since_last_grid_point = DayCountCalculator.compute_accrual_length(start_date=datetime_grid[lower_datetime_index],
                                                                            end_date=datetime_obj,
                                                                            dcc=day_count_convention)
 
-    time_to_next_grid_point = DayCountCalculator.compute_accrual_length(start_date=datetime_obj,
-                                                                        end_date=datetime_grid[upper_datetime_index],
-                                                                        dcc=day_count_convention)
-
-    interpolation_factor = time_to_next_grid_point / (time_to_next_grid_point + time_since_last_grid_point)
-
-    prev_value = path[:, lower_datetime_index]
-    next_value = path[:, upper_datetime_index]
+    # weight is zero whenever datetime_obj lies exactly on a grid point,
+    # so no separate branch is required for exact matches
+    interpolation_weight = time_since_last_grid_point / grid_segment_length if grid_segment_length > 0.0 else 0.0
 
-
-    return  next_value * interpolation_factor + prev_value * (1 - interpolation_factor)
+    return _interp_path(path, lower_datetime_index + interpolation_weight)
 
 class BrownianMotion(Callable):
     """
@@ -75,18 +144,34 @@ class BrownianMotion(Callable):
                  end_date_time: datetime,
                  dimension: int = 1,
                  correlation_matrix: Optional[np.ndarray] = None,
-                 day_count_convention: DayCountConvention = DayCountConvention.ACTUAL_OVER_ACTUAL) -> None:
+                 day_count_convention: DayCountConvention = DayCountConvention.ACTUAL_OVER_ACTUAL,
+                 dtype: np.dtype = np.float64) -> None:
 
         self._start_date_time = start_date_time
         self._end_date_time = end_date_time
         self._dimension = dimension
+        self._dtype = np.dtype(dtype)  # np.float32 halves the memory traffic of large path sets
         self.correlation_matrix = correlation_matrix if correlation_matrix is not None else np.eye(self._dimension)
-        assert dimension, dimension == self.correlation_matrix.shape
-        self.lower_triangular_mat = np.linalg.cholesky(self.correlation_matrix)
+
+        if self.correlation_matrix.shape != (self._dimension, self._dimension):
+            raise ValueError(f'Correlation matrix of shape {self.correlation_matrix.shape} does not match '
+                             f'the provided dimension {dimension}; expected shape {(dimension, dimension)}.')
+
+        self._is_identity_correlation = np.array_equal(self.correlation_matrix, np.eye(self._dimension))
+        # the Cholesky factor of the identity is the identity itself, so the
+        # factorization is only computed (once) for genuinely correlated motions
+        self.lower_triangular_mat = np.asarray(self.correlation_matrix if self._is_identity_correlation
+                                               else np.linalg.cholesky(self.correlation_matrix),
+                                               dtype=self._dtype)
         self._path = None
         self._datetimes = None
         self._dt_increments = None
+        self._time_grid = None
+        self._increment_buffer = None
         self.day_count_convention = day_count_convention
+        self._total_accrual = DayCountCalculator.compute_accrual_length(start_date=start_date_time,
+                                                                        end_date=end_date_time,
+                                                                        dcc=day_count_convention)
 
     @property
     def start_date_time(self) -> datetime:
@@ -112,6 +197,16 @@ class BrownianMotion(Callable):
     def datetimes(self):
         return self._datetimes
 
+    @property
+    def time_grid(self) -> Optional[np.ndarray]:
+        """ The cumulative accrual lengths of the datetime grid points from the start datetime. """
+        return self._time_grid
+
+    @property
+    def total_accrual(self) -> float:
+        """ The accrual length between the start and end datetimes, a constant for the object's lifetime. """
+        return self._total_accrual
+
     def __call__(self, datetime_obj: datetime) -> np.array:
         """
         Shortcut to allow the user to directly call the BrownianMotion datetime rather
@@ -122,18 +217,20 @@ class BrownianMotion(Callable):
                                      end_date_time=self.end_date_time,
                                      day_count_convention=self.day_count_convention,
                                      datetime_grid=self.datetimes,
-                                     path=self.path)
+                                     path=self.path,
+                                     dt_increments=self.dt_increments,
+                                     time_grid=self.time_grid)
 
-    def generate_increments(
+    def _generate_scaled_increments(
             self,
             dt: timedelta | relativedelta,
             seed: Optional[int] = None
-    ) -> tuple[np.ndarray, np.array]:
+    ) -> np.ndarray:
         """
-        Returns a num_increments x num_steps numpy nd.array, where each row corresponds to a
-        Correlated Brownian Motion increments are generated by applying the Cholesky Decomposition to the correlation matrix
-        and multiplying the resulting lower-triangular matrix to the uncorrelated brownian motion increments.
-        See Brigo and Mercurio's *Interest Rate Models-Theory and Practice Second Ed.*, page 31.
+        Generates the datetime grid, the per-step accrual lengths, and a
+        dimension x num_steps array of independent standard normal increments
+        scaled by the square root of the per-step accrual lengths. The
+        increments are uncorrelated; inducing correlation is left to the caller.
         """
         self._datetimes = Scheduler.generate_dates_by_increments(start_date=self.start_date_time,
                                                            end_date=self.end_date_time,
@@ -142,39 +239,145 @@ class BrownianMotion(Callable):
         if self.datetimes[-1] < self.end_date_time:
             self.datetimes.append(self.end_date_time)
 
-        self._dt_increments = np.array([DayCountCalculator.compute_accrual_length(start, end, self.day_count_convention)
-                         for start, end in itertools.pairwise(self.datetimes)])
-
+        num_dates = len(self.datetimes)
+        constant_accrual_conventions = (DayCountConvention.ACTUAL_OVER_360,
+                                        DayCountConvention.ACTUAL_OVER_365,
+                                        DayCountConvention.ACTUAL_OVER_365_POINT_25)
+
+        if isinstance(dt, timedelta) and self.day_count_convention in constant_accrual_conventions and num_dates > 2:
+            # evenly-spaced datetimes under a fixed-denominator convention have a constant
+            # accrual per step, except possibly for the final appended end date
+            self._dt_increments = np.full(num_dates - 1,
+                                          DayCountCalculator.compute_accrual_length(self.datetimes[0],
+                                                                                    self.datetimes[1],
+                                                                                    self.day_count_convention))
+            self._dt_increments[-1] = DayCountCalculator.compute_accrual_length(self.datetimes[-2],
+                                                                                self.datetimes[-1],
+                                                                                self.day_count_convention)
+        elif self.day_count_convention in constant_accrual_conventions:
+            # fixed-denominator accruals are additive, so increments are differences of
+            # cumulative accruals from the start date; halves the Python-level date math
+            accruals = np.fromiter((DayCountCalculator.compute_accrual_length(self.start_date_time,
+                                                                              date_time,
+                                                                              self.day_count_convention)
+                                    for date_time in self.datetimes),
+                                   dtype=np.float64,
+                                   count=num_dates)
+            self._dt_increments = np.diff(accruals)
+        else:
+            # ACT/ACT and 30/360 accruals are not additive across intraday datetimes,
+            # so the increments must be computed pairwise
+            self._dt_increments = np.array([DayCountCalculator.compute_accrual_length(start, end, self.day_count_convention)
+                                            for start, end in itertools.pairwise(self.datetimes)])
+
+        self._time_grid = np.concatenate(([0.0], np.cumsum(self._dt_increments)))
 
         num_steps = len(self.dt_increments)
-        np.random.seed(seed=seed)
-        brownian_increments = np.random.standard_normal((self.dimension, num_steps)) * np.sqrt(self.dt_increments)
-        brownian_increments = self.lower_triangular_mat @ brownian_increments  # induce correlation
+        if self._increment_buffer is None or self._increment_buffer.shape != (self.dimension, num_steps):
+            self._increment_buffer = np.empty((self.dimension, num_steps), dtype=self._dtype)
+
+        rng = np.random.default_rng(seed)
+        rng.standard_normal(dtype=self._dtype, out=self._increment_buffer)  # fill the reused buffer without allocating
+        self._increment_buffer *= np.sqrt(self.dt_increments)
+        return self._increment_buffer
+
+    def generate_increments(
+            self,
+            dt: timedelta | relativedelta,
+            seed: Optional[int] = None
+    ) -> tuple[np.ndarray, np.array]:
+        """
+        Returns a num_increments x num_steps numpy nd.array, where each row corresponds to a
+        Correlated Brownian Motion increments are generated by applying the Cholesky Decomposition to the correlation matrix
+        and multiplying the resulting lower-triangular matrix to the uncorrelated brownian motion increments.
+        See Brigo and Mercurio's *Interest Rate Models-Theory and Practice Second Ed.*, page 31.
+        """
+        brownian_increments = self._apply_correlation(self._generate_scaled_increments(dt, seed=seed))
         return brownian_increments, self.dt_increments
 
+    def _apply_correlation(self, increments: np.ndarray) -> np.ndarray:
+        """
+        Induces correlation across dimensions by multiplying the increments by the
+        lower-triangular Cholesky factor of the correlation matrix. Uses the BLAS
+        triangular routine dtrmm, which performs half the floating-point work of a
+        general matrix multiply. Uncorrelated motions are returned as-is.
+        """
+        if self._is_identity_correlation:
+            return increments
+
+        triangular_multiply = strmm if self._dtype == np.float32 else dtrmm
+        return triangular_multiply(1.0, self.lower_triangular_mat, increments, lower=1)
+
     def generate_path(self, dt: timedelta | relativedelta, set_path: bool = True, seed: Optional[int] = None) -> np.array:
         """
         Generates Brownian Motion sample paths.
 
         dt is a float whose scale is years, that is dt=1 corresponds to dt increments of a single year.
+
+        The correlation mixing and the cumulative sum are fused into a single
+        compiled pass over the increments, so only the path array is allocated.
         """
-        brownian_increments, dt_increments = self.generate_increments(dt, seed=seed)
-        brownian_paths = np.zeros((self.dimension, brownian_increments.shape[1] + 1))
-        brownian_paths[:, 1:] = brownian_increments.cumsum(axis=1)
+        scaled_increments = self._generate_scaled_increments(dt, seed=seed)
+
+        if self._is_identity_correlation:
+            brownian_paths = np.zeros((self.dimension, scaled_increments.shape[1] + 1), dtype=self._dtype)
+            np.cumsum(scaled_increments, axis=1, out=brownian_paths[:, 1:])
+        else:
+            brownian_paths = _mix_and_accumulate(self.lower_triangular_mat, scaled_increments)
 
         if set_path:
             self._path = brownian_paths
 
         return brownian_paths
 
-    #def generate_num_steps_from_dt(self, dt: float) -> int:
-    #    """ """
-    #    time_diff = self.end_date_time - self.start_date_time
-    #    time_diff_in_years = math.ceil(DayCountCalculator.time_fraction_in_years(time_diff))
-    #    num_steps = math.ceil(time_diff_in_years / dt)
-    #    return num_steps
+    def evaluate(self, datetime_objs: list[datetime]) -> np.ndarray:
+        """
+        Evaluates the Brownian motion at a whole sequence of datetimes at once,
+        returning a num_dates x dimension array of path values. The datetime to
+        elapsed-time conversion happens per date in Python, but the grid lookup is
+        a single vectorized searchsorted and the interpolation itself is one
+        guvectorized call across all query dates.
+        """
+        if self.path is None:
+            raise ValueError('Brownian Motion called when path is None. '
+                             'First call generate_path method with set_path variable set to True.')
+
+        datetime_objs = list(datetime_objs)
+        out_of_range = [datetime_obj for datetime_obj in datetime_objs
+                        if datetime_obj < self.start_date_time or datetime_obj > self.end_date_time]
+        if out_of_range:
+            raise ValueError(f'Provided datetime {str(out_of_range[0])} is outside of'
+                             f'the range {str(self.start_date_time)} to {str(self.end_date_time)}.')
+
+        elapsed_times = np.fromiter((DayCountCalculator.compute_accrual_length(self.start_date_time,
+                                                                               datetime_obj,
+                                                                               self.day_count_convention)
+                                     for datetime_obj in datetime_objs),
+                                    dtype=np.float64,
+                                    count=len(datetime_objs))
+
+        lower_indices = np.searchsorted(self.time_grid, elapsed_times, side='right') - 1
+        np.clip(lower_indices, 0, len(self.time_grid) - 2, out=lower_indices)
+        segment_lengths = self.time_grid[lower_indices + 1] - self.time_grid[lower_indices]
+        safe_segments = np.where(segment_lengths > 0.0, segment_lengths, 1.0)
+        weights = np.clip((elapsed_times - self.time_grid[lower_indices]) / safe_segments, 0.0, 1.0)
+
+        return _interp_path_batch(self.path, lower_indices + weights)
+
+    def generate_num_steps_from_dt(self, dt: float) -> int:
+        """
+        Returns the number of steps of size dt (in years) required to cover the interval
+        between the start and end datetimes. Uses the accrual length cached at
+        construction rather than recomputing the start-to-end date math.
+        """
+        return math.ceil(self.total_accrual / dt)
 
     def plot(self):
+        # imported lazily so that pricing code importing this module does not
+        # pay the matplotlib/pandas import cost
+        import matplotlib.pyplot as plt
+        import pandas as pd
+
         plural = 's' if self.dimension > 1 else ''
         title_str = f'Brownian Motion Sample Path{plural}'
         plt.figure(figsize=(10, 6))
@@ -0,0 +1,77 @@
+"""
+Unit tests for fixedIncome.src.assets.rates.linear_rates.interest_rate_swap.py
+"""
+from datetime import date
+
+from fixedIncome.src.scheduling_tools.holidays import US_FEDERAL_HOLIDAYS
+from fixedIncome.src.curves.curve_enumerations import CurveIndex
+from fixedIncome.src.scheduling_tools.schedule_enumerations import (BusinessDayAdjustment,
+                                                                    SettlementConvention,
+                                                                    PaymentFrequency,
+                                                                    DayCountConvention)
+from fixedIncome.src.assets.rates.linear_rates.interest_rate_swap import (TermInterestRateSwap,
+                                                                          InterestRateSwapDirection)
+
+
+def create_test_swap() -> TermInterestRateSwap:
+    """ Creates a standard 10Y LIBOR swap used throughout the tests. """
+    return TermInterestRateSwap(
+        float_index=CurveIndex.LIBOR_3M,
+        direction=InterestRateSwapDirection.RECEIVER_FIXED,
+        fixed_rate=0.055,
+        notional=1_000_000,
+        purchase_date=date(2024, 1, 1),
+        settlement_convention=SettlementConvention.T_PLUS_TWO_BUSINESS,
+        tenor='10Y',
+        floating_leg_payment_frequency=PaymentFrequency.SEMI_ANNUAL,
+        fixed_leg_payment_frequency=PaymentFrequency.QUARTERLY,
+        floating_leg_day_count_convention=DayCountConvention.ACTUAL_OVER_360,
+        fixed_leg_day_count_convention=DayCountConvention.THIRTY_OVER_THREESIXTY,
+        holiday_calendar=US_FEDERAL_HOLIDAYS,
+        payment_delay=SettlementConvention.T_PLUS_ZERO_BUSINESS,
+        business_day_adjustment=BusinessDayAdjustment.MODIFIED_FOLLOWING
+    )
+
+
+def test_accrual_schedules_span_the_accrual_period() -> None:
+    """
+    Tests that both leg accrual schedules begin on the swap's start accrual date
+    and end on its (business-day adjusted) end accrual date.
+    """
+    swap = create_test_swap()
+
+    for schedule in (swap.generate_fixed_leg_accrual_schedule(),
+                     swap.generate_floating_leg_accrual_schedule()):
+        assert schedule[0].start_accrual == swap.date_adjustment_function(swap.start_accrual_date)
+        assert schedule[-1].end_accrual == swap.date_adjustment_function(swap.end_accrual_date)
+
+
+def test_accrual_factors_are_positive() -> None:
+    """ Tests that every accrual factor in both leg schedules is strictly positive. """
+    swap = create_test_swap()
+
+    assert all(accrual.accrual_factor > 0 for accrual in swap.generate_fixed_leg_accrual_schedule())
+    assert all(accrual.accrual_factor > 0 for accrual in swap.generate_floating_leg_accrual_schedule())
+
+
+def test_accrual_schedules_are_cached() -> None:
+    """
+    Tests that repeated calls to the accrual schedule generators return the cached
+    schedule rather than re-computing it.
+    """
+    swap = create_test_swap()
+
+    assert swap.generate_fixed_leg_accrual_schedule() is swap.generate_fixed_leg_accrual_schedule()
+    assert swap.generate_floating_leg_accrual_schedule() is swap.generate_floating_leg_accrual_schedule()
+
+
+def test_accrual_schedule_arrays_agree_with_row_iteration() -> None:
+    """
+    Tests that the accrual factor array of a SwapAccrualSchedule agrees with the
+    accrual factors of the SwapAccrual rows obtained by iterating the schedule.
+    """
+    swap = create_test_swap()
+    schedule = swap.generate_fixed_leg_accrual_schedule()
+
+    assert len(schedule.accrual_factors) == len(schedule)
+    assert all(row.accrual_factor == factor for row, factor in zip(schedule, schedule.accrual_factors))
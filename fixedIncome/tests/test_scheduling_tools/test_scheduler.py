@@ -128,3 +128,28 @@ def test_modified_following_adjustment_goes_back_at_months_end() -> None:
     assert test_result == expected_result
 
 
+
+
+def test_adjust_dates_agrees_with_single_date_adjustments() -> None:
+    """
+    Tests that the batch adjust_dates method produces the same results as applying
+    the corresponding single-date adjustment function to each date individually.
+    """
+    from datetime import timedelta
+    from fixedIncome.src.scheduling_tools.schedule_enumerations import BusinessDayAdjustment
+
+    test_dates = [date(2023, 1, 1) + timedelta(days=day_count) for day_count in range(0, 730)]
+
+    following_results = Scheduler.adjust_dates(test_dates,
+                                               business_day_adjustment=BusinessDayAdjustment.FOLLOWING,
+                                               holiday_calendar=US_FEDERAL_HOLIDAYS)
+
+    modified_following_results = Scheduler.adjust_dates(test_dates,
+                                                        business_day_adjustment=BusinessDayAdjustment.MODIFIED_FOLLOWING,
+                                                        holiday_calendar=US_FEDERAL_HOLIDAYS)
+
+    assert all(batch_result == Scheduler.following_date_adjustment(date_obj, US_FEDERAL_HOLIDAYS)
+               for date_obj, batch_result in zip(test_dates, following_results))
+
+    assert all(batch_result == Scheduler.modified_following_date_adjustment(date_obj, US_FEDERAL_HOLIDAYS)
+               for date_obj, batch_result in zip(test_dates, modified_following_results))
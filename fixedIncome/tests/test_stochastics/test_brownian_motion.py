@@ -51,4 +51,27 @@ def test_correlation_of_brownian_increments_is_within_error_of_provided_matrix()
     bm.generate_path(dt=timedelta(hours=1), seed=1)
 
     path_increments = np.diff(bm.path, axis=1)
-    np.allclose(correlation_matrix, np.corrcoef(path_increments))
\ No newline at end of file
+    np.allclose(correlation_matrix, np.corrcoef(path_increments))
+
+def test_batch_evaluate_agrees_with_individual_calls() -> None:
+    """
+    Tests that evaluating the Brownian motion on a sequence of datetimes
+    produces the same values as calling the object on each datetime individually.
+    """
+    PASS_THRESH = 1E-13
+
+    start_time = datetime(2023, 10, 15, 0, 0, 0, 0)
+    end_time = datetime(2023, 10, 16, 0, 0, 0, 0)
+
+    bm = BrownianMotion(start_date_time=start_time,
+                        end_date_time=end_time,
+                        dimension=1,
+                        correlation_matrix=None)
+
+    bm.generate_path(dt=timedelta(hours=1), seed=1)
+
+    date_times = [start_time + timedelta(minutes=90 * index) for index in range(16)]
+    batch_values = bm.evaluate(date_times)
+
+    assert all(abs(batch_value - bm(date_time_obj)) < PASS_THRESH
+               for date_time_obj, batch_value in zip(date_times, batch_values))